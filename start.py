@@ -6,17 +6,26 @@ This single script handles both initial setup and starting the application
 
 import sys
 import os
+import re
 import subprocess
 import argparse
 import time
 import socket
 import signal
+import select
 import shutil
+import shlex
+import functools
+import json
+import hashlib
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import threading
+import queue
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 
 # ANSI color codes
 class Colors:
@@ -41,96 +50,479 @@ def write_status(message, msg_type="INFO"):
     color = colors.get(msg_type, Colors.WHITE)
     print(f"{color}[{timestamp}] {msg_type}: {message}{Colors.ENDC}")
 
+@functools.lru_cache(maxsize=None)
 def test_command(command):
     """Check if a command exists"""
     return shutil.which(command) is not None
 
 def test_port(port):
-    """Check if a port is in use"""
+    """Check if something is accepting connections on a port"""
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(1)
+    sock.settimeout(0.1)
     result = sock.connect_ex(('localhost', port))
     sock.close()
     return result == 0
 
+BACKEND_PORTS = range(8082, 8092)
+FRONTEND_PORTS = range(3002, 3012)
+
+def _find_free_ports(ranges):
+    """Find the first bindable port in each named range, e.g.
+    {'backend': range(8082, 8092)} -> {'backend': 8082}, or None when all are taken.
+    A port chosen for one range is skipped for the others, so ranges never share a port"""
+    ports = {}
+    for name, candidates in ranges.items():
+        ports[name] = None
+        for port in candidates:
+            if port in ports.values():
+                continue
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if sys.platform.startswith("linux"):
+                # Ignore TIME_WAIT leftovers from a previous run, like the services
+                # themselves do; on Linux a live listener still makes bind fail,
+                # but macOS/BSD would let a wildcard bind past a 127.0.0.1 listener
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                # Fails instantly with EADDRINUSE when taken, no handshake or timeout
+                sock.bind(('', port))
+            except OSError:
+                continue
+            finally:
+                sock.close()
+            ports[name] = port
+            break
+    return ports
+
 def find_free_port(start_port, max_attempts=10):
     """Find a free port starting from start_port"""
-    for port in range(start_port, start_port + max_attempts):
-        if not test_port(port):
-            return port
-    return None
+    return _find_free_ports({'port': range(start_port, start_port + max_attempts)})['port']
+
+def _scan_names(path):
+    """List the entry names in a directory, or nothing if it cannot be read"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+@dataclass
+class Layout:
+    """Which parts of the project are present, read with one scandir per directory"""
+    has_backend: bool = False
+    has_frontend: bool = False
+    has_node_modules: bool = False
+    has_mvnw: bool = False
+
+    def refresh(self):
+        """Re-scan the project tree, e.g. after npm install"""
+        top = _scan_names(".")
+        self.has_backend = "backend" in top
+        self.has_frontend = "frontend" in top
+        self.has_mvnw = self.has_backend and "mvnw" in _scan_names("backend")
+        self.has_node_modules = self.has_frontend and "node_modules" in _scan_names("frontend")
+        return self
+
+_layout = None
+
+def _project_layout():
+    """Return the cached project layout, scanning it on first use"""
+    global _layout
+    if _layout is None:
+        _layout = Layout().refresh()
+    return _layout
+
+_HELP_TEXT = f"""\
+{Colors.CYAN}Medium Blog Platform - Unified Setup and Start Script{Colors.ENDC}
+{Colors.CYAN}====================================================={Colors.ENDC}
+
+{Colors.CYAN}USAGE:{Colors.ENDC}
+    {Colors.CYAN}python start.py [COMMAND]{Colors.ENDC}
+
+{Colors.CYAN}COMMANDS:{Colors.ENDC}
+    {Colors.CYAN}setup      Run initial setup (install dependencies, compile){Colors.ENDC}
+    {Colors.CYAN}start      Start both backend and frontend{Colors.ENDC}
+    {Colors.CYAN}backend    Start only the backend{Colors.ENDC}
+    {Colors.CYAN}frontend   Start only the frontend{Colors.ENDC}
+    {Colors.CYAN}help       Show this help message{Colors.ENDC}
+
+{Colors.CYAN}EXAMPLES:{Colors.ENDC}
+    {Colors.CYAN}python start.py setup     # First time setup{Colors.ENDC}
+    {Colors.CYAN}python start.py start     # Start both services{Colors.ENDC}
+    {Colors.CYAN}python start.py backend   # Start backend only{Colors.ENDC}
+    {Colors.CYAN}python start.py frontend  # Start frontend only{Colors.ENDC}
+
+{Colors.CYAN}REQUIREMENTS:{Colors.ENDC}
+    {Colors.CYAN}- Python 3.6 or higher{Colors.ENDC}
+    {Colors.CYAN}- Java 17 or higher{Colors.ENDC}
+    {Colors.CYAN}- Node.js 16 or higher{Colors.ENDC}
+    {Colors.CYAN}- MongoDB (local or Docker){Colors.ENDC}
+
+{Colors.CYAN}QUICK START:{Colors.ENDC}
+    {Colors.CYAN}1. python start.py setup   # First time only{Colors.ENDC}
+    {Colors.CYAN}2. python start.py start   # Start the application{Colors.ENDC}
+
+{Colors.CYAN}ACCESS URLs:{Colors.ENDC}
+    {Colors.CYAN}Frontend: http://localhost:<PORT> (auto-selected, typically 3002+){Colors.ENDC}
+    {Colors.CYAN}Backend API: http://localhost:<PORT>/api (auto-selected, typically 8082+){Colors.ENDC}
+
+{Colors.CYAN}NOTE:{Colors.ENDC}
+    {Colors.CYAN}Ports are automatically selected from available ports to avoid conflicts.{Colors.ENDC}
+    {Colors.CYAN}The actual URLs will be displayed when you start the services.{Colors.ENDC}
+
+{Colors.CYAN}Sample Login Credentials:{Colors.ENDC}
+    {Colors.CYAN}Username: john_doe | Password: demo123{Colors.ENDC}
+    {Colors.CYAN}Username: jane_smith | Password: demo123{Colors.ENDC}
+"""
 
 def show_help():
     """Display help information"""
-    print(f"{Colors.CYAN}Medium Blog Platform - Unified Setup and Start Script{Colors.ENDC}")
-    print(f"{Colors.CYAN}====================================================={Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}USAGE:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}python start.py [COMMAND]{Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}COMMANDS:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}setup      Run initial setup (install dependencies, compile){Colors.ENDC}")
-    print(f"    {Colors.CYAN}start      Start both backend and frontend{Colors.ENDC}")
-    print(f"    {Colors.CYAN}backend    Start only the backend{Colors.ENDC}")
-    print(f"    {Colors.CYAN}frontend   Start only the frontend{Colors.ENDC}")
-    print(f"    {Colors.CYAN}help       Show this help message{Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}EXAMPLES:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}python start.py setup     # First time setup{Colors.ENDC}")
-    print(f"    {Colors.CYAN}python start.py start     # Start both services{Colors.ENDC}")
-    print(f"    {Colors.CYAN}python start.py backend   # Start backend only{Colors.ENDC}")
-    print(f"    {Colors.CYAN}python start.py frontend  # Start frontend only{Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}REQUIREMENTS:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}- Python 3.6 or higher{Colors.ENDC}")
-    print(f"    {Colors.CYAN}- Java 17 or higher{Colors.ENDC}")
-    print(f"    {Colors.CYAN}- Node.js 16 or higher{Colors.ENDC}")
-    print(f"    {Colors.CYAN}- MongoDB (local or Docker){Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}QUICK START:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}1. python start.py setup   # First time only{Colors.ENDC}")
-    print(f"    {Colors.CYAN}2. python start.py start   # Start the application{Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}ACCESS URLs:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}Frontend: http://localhost:<PORT> (auto-selected, typically 3002+){Colors.ENDC}")
-    print(f"    {Colors.CYAN}Backend API: http://localhost:<PORT>/api (auto-selected, typically 8082+){Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}NOTE:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}Ports are automatically selected from available ports to avoid conflicts.{Colors.ENDC}")
-    print(f"    {Colors.CYAN}The actual URLs will be displayed when you start the services.{Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}Sample Login Credentials:{Colors.ENDC}")
-    print(f"    {Colors.CYAN}Username: john_doe | Password: demo123{Colors.ENDC}")
-    print(f"    {Colors.CYAN}Username: jane_smith | Password: demo123{Colors.ENDC}")
+    sys.stdout.write(_HELP_TEXT)
+
+def _pump_output(stream, prefix=""):
+    """Copy a child's output to our stdout line by line"""
+    for line in stream:
+        sys.stdout.write(prefix + line)
+        sys.stdout.flush()
+
+# Snapshot of our environment; children get a shallow copy plus their overrides
+_BASE_ENV = dict(os.environ)
+
+def _env_with(**overrides):
+    """Build a child environment from _BASE_ENV with the given variables set"""
+    env = _BASE_ENV.copy()
+    env.update(overrides)
+    return env
+
+def _spawn(cmd, *, cwd=None, env=None, **kwargs):
+    """Start a command without a shell or preexec_fn so CPython 3.10+ can use vfork on Linux"""
+    assert kwargs.get('preexec_fn') is None, "preexec_fn forces the slow fork+exec path"
+    # Resolve wrappers such as npm.cmd on Windows without going through a shell
+    cmd = [shutil.which(cmd[0]) or cmd[0]] + list(cmd[1:])
+    return subprocess.Popen(cmd, cwd=cwd, env=env, shell=False, close_fds=True, **kwargs)
+
+class ChildProcesses:
+    """Helper processes started from worker threads, so they can be stopped together"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes = []
+        self._stopped = False
+
+    def add(self, process):
+        """Track a process; one started after stop_all() is terminated right away"""
+        with self._lock:
+            if not self._stopped:
+                self._processes.append(process)
+                return
+        process.terminate()
+
+    def stop_all(self, timeout=5):
+        """Terminate every tracked process that is still running and wait for it"""
+        with self._lock:
+            self._stopped = True
+            processes = list(self._processes)
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
 
-def run_command(cmd, cwd=None, shell=False, show_output=False):
+def run_command(cmd, cwd=None, show_output=False, prefix="", children=None):
     """Run a command and return the result"""
     try:
-        if isinstance(cmd, str) and not shell:
-            cmd = cmd.split()
+        if isinstance(cmd, str):
+            cmd = shlex.split(cmd)
         
         if show_output:
-            # Show real-time output
-            result = subprocess.run(
+            # Stream real-time output through a pipe
+            process = _spawn(
                 cmd,
                 cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                shell=shell
+                errors='replace',
+                bufsize=1
             )
-            return result.returncode == 0, "", ""
+            if children is not None:
+                children.add(process)
+            pump = threading.Thread(target=_pump_output, args=(process.stdout, prefix), daemon=True)
+            pump.start()
+            process.wait()
+            pump.join()
+            process.stdout.close()
+            return process.returncode == 0, "", ""
         else:
             # Capture output
-            result = subprocess.run(
+            process = _spawn(
                 cmd,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
-                shell=shell
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
             )
-            return result.returncode == 0, result.stdout, result.stderr
+            if children is not None:
+                children.add(process)
+            stdout, stderr = process.communicate()
+            return process.returncode == 0, stdout, stderr
     except Exception as e:
         return False, "", str(e)
 
+def run_first_line(cmd, cwd=None, stderr_too=False, pattern=None, max_lines=10):
+    """Run a command and return only the first line it prints ('' if it cannot start).
+    With a pattern, return the first of up to max_lines lines that matches it instead"""
+    try:
+        process = _spawn(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if stderr_too else subprocess.DEVNULL,
+            text=True,
+            errors='replace'
+        )
+    except OSError:
+        return ""
+    with process:
+        result = ""
+        for _ in range(max_lines if pattern else 1):
+            line = process.stdout.readline()
+            if not line:
+                break
+            if pattern is None or pattern.search(line):
+                result = line.strip()
+                break
+        # Everything after the line we wanted is of no interest
+        if process.poll() is None:
+            process.terminate()
+    return result
+
+TOOL_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "medium-blog", "tools.json")
+TOOL_CACHE_TTL = 24 * 60 * 60
+_tool_version_cache = None
+_tool_version_lock = threading.Lock()
+
+def _load_tool_cache():
+    """Load cached version probes, ignoring a missing or expired cache file"""
+    try:
+        if time.time() - os.path.getmtime(TOOL_CACHE_FILE) > TOOL_CACHE_TTL:
+            return {}
+        with open(TOOL_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _tool_cache_key(cmd, args):
+    """Identify the exact binary behind cmd, so switching installs misses the cache"""
+    real = os.path.realpath(shutil.which(cmd) or cmd)
+    try:
+        mtime = os.stat(real).st_mtime_ns
+    except OSError:
+        mtime = 0
+    parts = [real, str(mtime)] + list(args)
+    # java and mvn can be launchers that pick the JDK from JAVA_HOME
+    if cmd in ("java", "mvn"):
+        parts.append(f"JAVA_HOME={os.environ.get('JAVA_HOME', '')}")
+    return " ".join(parts)
+
+def get_tool_version(cmd, args, stderr_too=False, pattern=None, accept=None):
+    """Return the first line (or first line matching pattern) of a version probe such as
+    `java -version` ('' on failure), reusing results cached for 24h. Only results that
+    pass accept(version) are cached"""
+    global _tool_version_cache
+    key = _tool_cache_key(cmd, args)
+    with _tool_version_lock:
+        if _tool_version_cache is None:
+            _tool_version_cache = _load_tool_cache()
+        cached = _tool_version_cache.get(key)
+        if isinstance(cached, str):
+            return cached
+
+    version = run_first_line([cmd] + list(args), stderr_too=stderr_too, pattern=pattern)
+    if version and (accept is None or accept(version)):
+        with _tool_version_lock:
+            _tool_version_cache[key] = version
+            try:
+                os.makedirs(os.path.dirname(TOOL_CACHE_FILE), exist_ok=True)
+                with open(TOOL_CACHE_FILE, 'w') as f:
+                    json.dump(_tool_version_cache, f)
+            except OSError:
+                pass
+    return version
+
+INSTALL_HINTS = {
+    "Java": "Please install Java 17+ from: https://adoptium.net/",
+    "Node.js": "Please install Node.js 16+ from: https://nodejs.org/",
+    "npm": "npm should come with Node.js. Please reinstall Node.js.",
+}
+OPTIONAL_TOOLS = {"Maven"}
+JAVA_MIN_VERSION = 17
+NODE_MIN_VERSION = 16
+
+_JAVA_VERSION_RE = re.compile(r'version "?(\d+)\.?(\d+)?\.?(\d+)?[^"]*"?')
+
+def _java_major(version):
+    """Major version from `java -version` output, or None"""
+    match = _JAVA_VERSION_RE.search(version)
+    return int(match.group(1)) if match else None
+
+def _node_major(version):
+    """Major version from `node --version` output, or None"""
+    try:
+        return int(version.lstrip('v').split('.')[0])
+    except ValueError:
+        return None
+
+def check_java():
+    """Check Java installation, returns (name, ok, version, error)"""
+    if not test_command("java"):
+        return "Java", False, "", "Java is not installed or not in PATH!"
+    # java -version prints to stderr, possibly after "Picked up JAVA_TOOL_OPTIONS: ..."
+    version = get_tool_version("java", ["-version"], stderr_too=True, pattern=_JAVA_VERSION_RE,
+                               accept=lambda v: (_java_major(v) or 0) >= JAVA_MIN_VERSION)
+    major = _java_major(version)
+    if major is None:
+        return "Java", False, "", f"Could not determine Java version, Java {JAVA_MIN_VERSION}+ is required"
+    if major < JAVA_MIN_VERSION:
+        return "Java", False, "", f"Java {JAVA_MIN_VERSION}+ required, but found Java {major}"
+    return "Java", True, version, ""
+
+def check_node():
+    """Check Node.js installation, returns (name, ok, version, error)"""
+    if not test_command("node"):
+        return "Node.js", False, "", "Node.js is not installed or not in PATH!"
+    version = get_tool_version("node", ["--version"],
+                               accept=lambda v: (_node_major(v) or 0) >= NODE_MIN_VERSION)
+    major = _node_major(version)
+    if major is None:
+        return "Node.js", True, "", ""
+    if major < NODE_MIN_VERSION:
+        return "Node.js", False, "", f"Node.js {NODE_MIN_VERSION}+ required, but found {version}"
+    return "Node.js", True, version, ""
+
+def check_npm():
+    """Check npm installation, returns (name, ok, version, error)"""
+    if not test_command("npm"):
+        return "npm", False, "", "npm is not installed!"
+    version = get_tool_version("npm", ["--version"])
+    return "npm", True, f"v{version}" if version else "", ""
+
+def check_maven():
+    """Check Maven installation, returns (name, ok, version, error)"""
+    if not test_command("mvn"):
+        return "Maven", False, "", "Maven not found, will use Maven wrapper (mvnw)"
+    # A broken install prints an error instead of the "Apache Maven x.y.z" banner
+    version = get_tool_version("mvn", ["--version"])
+    return "Maven", True, version if "Maven" in version else "", ""
+
+SOURCE_STAMP = os.path.join("target", ".start-stamp")
+
+def _source_digest(backend_dir):
+    """Hash the path, mtime and size of pom.xml and every file under src"""
+    digest = hashlib.blake2b(digest_size=16)
+    paths = [os.path.join(backend_dir, "pom.xml")]
+    for root, dirs, files in os.walk(os.path.join(backend_dir, "src")):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files))
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+def _sources_changed(backend_dir, digest):
+    """Check if the sources hashed as digest differ from the last successful compile"""
+    try:
+        with open(os.path.join(backend_dir, SOURCE_STAMP), 'r') as f:
+            return f.read().strip() != digest
+    except OSError:
+        return True
+
+def _write_source_stamp(backend_dir, digest):
+    """Record the sources hashed as digest, taken before the compile, as compiled.
+    Edits made while Maven runs then still count as changed next time"""
+    try:
+        with open(os.path.join(backend_dir, SOURCE_STAMP), 'w') as f:
+            f.write(digest)
+    except OSError:
+        pass
+
+INSTALL_STAMP = os.path.join("node_modules", ".install-stamp")
+
+def _lockfile_digest(frontend_dir):
+    """Hash package-lock.json, or package.json when there is no lockfile"""
+    lock = os.path.join(frontend_dir, "package-lock.json")
+    if not os.path.exists(lock):
+        lock = os.path.join(frontend_dir, "package.json")
+    with open(lock, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _need_npm_install(frontend_dir):
+    """Check if dependencies changed since the last successful npm install"""
+    try:
+        with open(os.path.join(frontend_dir, INSTALL_STAMP), 'r') as f:
+            return f.read().strip() != _lockfile_digest(frontend_dir)
+    except OSError:
+        return True
+
+def _write_install_stamp(frontend_dir):
+    """Record the current lockfile as installed"""
+    try:
+        with open(os.path.join(frontend_dir, INSTALL_STAMP), 'w') as f:
+            f.write(_lockfile_digest(frontend_dir))
+    except OSError:
+        pass
+
+OFFLINE_MARKER = os.path.join("target", ".offline-ok")
+
+def _maven_offline(backend_dir):
+    """Check if an earlier run already resolved everything Maven needs"""
+    return os.path.exists(os.path.join(backend_dir, OFFLINE_MARKER))
+
+def _set_maven_offline(backend_dir, offline):
+    """Record whether the next Maven run can skip remote repositories"""
+    path = os.path.join(backend_dir, OFFLINE_MARKER)
+    try:
+        if offline:
+            open(path, 'w').close()
+        elif os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
+
+def _maven_args(maven_cmd, backend_dir, *goals):
+    """Build a Maven command line, running offline when an earlier run allows it"""
+    offline = ["-o"] if _maven_offline(backend_dir) else []
+    return [maven_cmd] + offline + list(goals)
+
+def _compile_backend(maven_cmd, backend_dir, **run_kwargs):
+    """Compile the backend, retrying online once if the offline attempt fails"""
+    result = run_command(_maven_args(maven_cmd, backend_dir, "compile"), cwd=backend_dir, **run_kwargs)
+    if not result[0] and _maven_offline(backend_dir):
+        write_status("Offline compile failed, retrying online...", "WARNING")
+        _set_maven_offline(backend_dir, False)
+        result = run_command([maven_cmd, "compile"], cwd=backend_dir, **run_kwargs)
+    return result
+
+def _npm_install(frontend_dir, **run_kwargs):
+    """Install frontend dependencies, preferring the local npm cache on repeat installs"""
+    cmd = ["npm", "install", "--no-audit", "--no-fund"]
+    if os.path.exists(os.path.join(frontend_dir, INSTALL_STAMP)):
+        result = run_command(cmd + ["--prefer-offline"], cwd=frontend_dir, **run_kwargs)
+        if result[0]:
+            return result
+        write_status("Cached npm install failed, retrying online...", "WARNING")
+    return run_command(cmd, cwd=frontend_dir, **run_kwargs)
+
+def _mvnw_path(backend_dir):
+    """Absolute path of the Maven wrapper, so it can be run without a shell"""
+    return os.path.abspath(os.path.join(backend_dir, "mvnw.cmd" if os.name == "nt" else "mvnw"))
+
 def invoke_setup():
     """Run initial setup"""
     print(f"{Colors.BLUE}Medium Blog Platform - Setup{Colors.ENDC}")
@@ -138,81 +530,39 @@ def invoke_setup():
     print("")
 
     # Check if running in correct directory
-    if not os.path.exists("backend") or not os.path.exists("frontend"):
+    layout = _project_layout()
+    if not layout.has_backend or not layout.has_frontend:
         write_status("Please run this script from the project root directory!", "ERROR")
         write_status(f"Current directory: {os.getcwd()}", "ERROR")
         sys.exit(1)
 
     write_status("Starting setup process...")
 
-    # Check Java
-    write_status("Checking Java installation...")
-    if test_command("java"):
-        success, stdout, stderr = run_command("java -version")
-        version_output = stderr if stderr else stdout
-        try:
-            # Try to extract version from output
-            if "version" in version_output:
-                # Extract version number
-                import re
-                match = re.search(r'version "?(\d+)\.?(\d+)?\.?(\d+)?[^"]*"?', version_output)
-                if match:
-                    major = int(match.group(1))
-                    if major >= 17:
-                        write_status(f"Java is installed: {version_output.splitlines()[0]}", "SUCCESS")
-                    else:
-                        write_status(f"Java 17+ required, but found Java {major}", "ERROR")
-                        sys.exit(1)
-                else:
-                    write_status("Could not determine Java version", "WARNING")
-        except Exception:
-            write_status("Could not determine Java version", "WARNING")
-    else:
-        write_status("Java is not installed or not in PATH!", "ERROR")
-        print("Please install Java 17+ from: https://adoptium.net/")
-        sys.exit(1)
+    # Check prerequisites concurrently, then report in a fixed order
+    write_status("Checking Java, Node.js, npm and Maven installations...")
+    checks = [check_java, check_node, check_npm, check_maven]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = list(executor.map(lambda check: check(), checks))
 
-    # Check Node.js
-    write_status("Checking Node.js installation...")
-    if test_command("node"):
-        success, stdout, stderr = run_command("node --version")
-        if success:
-            version = stdout.strip()
-            major = int(version.lstrip('v').split('.')[0])
-            if major >= 16:
-                write_status(f"Node.js is installed: {version}", "SUCCESS")
-            else:
-                write_status(f"Node.js 16+ required, but found {version}", "ERROR")
-                sys.exit(1)
-    else:
-        write_status("Node.js is not installed or not in PATH!", "ERROR")
-        print("Please install Node.js 16+ from: https://nodejs.org/")
-        sys.exit(1)
-
-    # Check npm
-    write_status("Checking npm installation...")
-    if test_command("npm"):
-        success, stdout, stderr = run_command("npm --version")
-        if success:
-            write_status(f"npm is installed: v{stdout.strip()}", "SUCCESS")
-    else:
-        write_status("npm is not installed!", "ERROR")
-        print("npm should come with Node.js. Please reinstall Node.js.")
+    failed = False
+    for name, ok, version, err in results:
+        if ok and version:
+            write_status(f"{name} is installed: {version}", "SUCCESS")
+        elif ok:
+            write_status(f"Could not determine {name} version", "WARNING")
+        elif name in OPTIONAL_TOOLS:
+            write_status(err, "WARNING")
+        else:
+            write_status(err, "ERROR")
+            print(INSTALL_HINTS[name])
+            failed = True
+    if failed:
         sys.exit(1)
 
-    # Check Maven
-    write_status("Checking Maven installation...")
-    if test_command("mvn"):
-        success, stdout, stderr = run_command("mvn --version")
-        if success:
-            write_status(f"Maven is installed: {stdout.splitlines()[0]}", "SUCCESS")
-    else:
-        write_status("Maven not found, will use Maven wrapper (mvnw)", "WARNING")
-
     # Find available ports
     write_status("Finding available ports...")
-    backend_port = find_free_port(8082)
-    frontend_port = find_free_port(3002)
+    ports = _find_free_ports({'backend': BACKEND_PORTS, 'frontend': FRONTEND_PORTS})
+    backend_port, frontend_port = ports['backend'], ports['frontend']
     
     if backend_port:
         write_status(f"Backend will use port {backend_port}", "SUCCESS")
@@ -240,7 +590,7 @@ def invoke_setup():
 
     # Navigate to backend directory
     backend_dir = "backend"
-    if not os.path.exists(backend_dir):
+    if not layout.has_backend:
         write_status("Backend directory not found!", "ERROR")
         sys.exit(1)
 
@@ -249,9 +599,9 @@ def invoke_setup():
     if test_command("mvn"):
         write_status("Using system Maven...")
         maven_cmd = "mvn"
-    elif os.path.exists(os.path.join(backend_dir, "mvnw")):
+    elif layout.has_mvnw:
         write_status("Using Maven wrapper...")
-        maven_cmd = "./mvnw"
+        maven_cmd = _mvnw_path(backend_dir)
     else:
         write_status("Neither Maven wrapper nor system Maven is available!", "ERROR")
         print("Please install Maven or restore Maven wrapper files.")
@@ -261,7 +611,8 @@ def invoke_setup():
     write_status(f"Installing backend dependencies and compiling with {maven_cmd}...", "INFO")
     write_status("This may take a few minutes on first run. Output will be shown below:", "INFO")
     print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-    success, stdout, stderr = run_command(f"{maven_cmd} clean compile", cwd=backend_dir, shell=True, show_output=True)
+    digest = _source_digest(backend_dir)
+    success, stdout, stderr = run_command([maven_cmd, "clean", "compile"], cwd=backend_dir, show_output=True)
     print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
     if not success:
         write_status("Backend setup failed!", "ERROR")
@@ -272,13 +623,14 @@ def invoke_setup():
         print(f"  3. Try running manually: cd backend && {maven_cmd} clean compile")
         print(f"  4. Check for any compilation errors in the output above")
         sys.exit(1)
+    _write_source_stamp(backend_dir, digest)
     write_status("Backend dependencies installed and compiled successfully", "SUCCESS")
 
     write_status("Setting up frontend...")
 
     # Navigate to frontend directory
     frontend_dir = "frontend"
-    if not os.path.exists(frontend_dir):
+    if not layout.has_frontend:
         write_status("Frontend directory not found!", "ERROR")
         sys.exit(1)
 
@@ -286,7 +638,7 @@ def invoke_setup():
     write_status("Installing frontend dependencies...", "INFO")
     write_status("This may take a few minutes. Output will be shown below:", "INFO")
     print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-    success, stdout, stderr = run_command("npm install", cwd=frontend_dir, shell=True, show_output=True)
+    success, stdout, stderr = run_command(["npm", "install"], cwd=frontend_dir, show_output=True)
     print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
     if not success:
         write_status("Frontend setup failed!", "ERROR")
@@ -296,13 +648,15 @@ def invoke_setup():
         print(f"  3. Clear npm cache: npm cache clean --force")
         print(f"  4. Delete node_modules and try again")
         sys.exit(1)
+    _write_install_stamp(frontend_dir)
+    layout.refresh()
     write_status("Frontend dependencies installed successfully", "SUCCESS")
 
     # Build to verify setup
     write_status("Building frontend to verify setup...", "INFO")
     write_status("This may take a few minutes. Output will be shown below:", "INFO")
     print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-    success, stdout, stderr = run_command("npm run build", cwd=frontend_dir, shell=True, show_output=True)
+    success, stdout, stderr = run_command(["npm", "run", "build"], cwd=frontend_dir, show_output=True)
     print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
     if success:
         write_status("Frontend built successfully", "SUCCESS")
@@ -335,7 +689,7 @@ def start_backend():
 
     # Find available port
     write_status("Finding available port for backend...")
-    backend_port = find_free_port(8082)
+    backend_port = find_free_port(BACKEND_PORTS.start, len(BACKEND_PORTS))
     if not backend_port:
         write_status("Could not find available port for backend (tried 8082-8091)", "ERROR")
         sys.exit(1)
@@ -352,9 +706,11 @@ def start_backend():
         print("  - Or run: docker run -d --name mongodb -p 27017:27017 mongo:6.0")
         input("Press Enter to continue anyway, or Ctrl+C to cancel...")
 
+    layout = _project_layout()
+
     # Navigate to backend directory
     backend_dir = "backend"
-    if not os.path.exists(backend_dir):
+    if not layout.has_backend:
         write_status("Backend directory not found!", "ERROR")
         sys.exit(1)
 
@@ -363,23 +719,29 @@ def start_backend():
     if test_command("mvn"):
         write_status("Using system Maven...")
         maven_cmd = "mvn"
-    elif os.path.exists(os.path.join(backend_dir, "mvnw")):
+    elif layout.has_mvnw:
         write_status("Using Maven wrapper...")
-        maven_cmd = "./mvnw"
+        maven_cmd = _mvnw_path(backend_dir)
     else:
         write_status("Neither Maven nor Maven wrapper found!", "ERROR")
         print("Please install Maven or restore Maven wrapper files.")
         sys.exit(1)
 
-    # Clean and compile backend first to ensure Lombok annotations are processed
-    write_status("Compiling backend...", "INFO")
-    success, stdout, stderr = run_command(f"{maven_cmd} clean compile", cwd=backend_dir, shell=True)
-    if not success:
-        write_status("Backend compilation failed!", "ERROR")
-        print(f"\n{Colors.RED}=== Compilation Error ==={Colors.ENDC}")
-        print(stderr)
-        sys.exit(1)
-    write_status("Backend compiled successfully", "SUCCESS")
+    # Compile backend first to ensure Lombok annotations are processed,
+    # unless nothing changed since the last successful compile
+    digest = _source_digest(backend_dir)
+    if _sources_changed(backend_dir, digest):
+        write_status("Compiling backend...", "INFO")
+        success, stdout, stderr = _compile_backend(maven_cmd, backend_dir)
+        if not success:
+            write_status("Backend compilation failed!", "ERROR")
+            print(f"\n{Colors.RED}=== Compilation Error ==={Colors.ENDC}")
+            print(stderr)
+            sys.exit(1)
+        _write_source_stamp(backend_dir, digest)
+        write_status("Backend compiled successfully", "SUCCESS")
+    else:
+        write_status("Backend sources unchanged, skipping compile", "INFO")
 
     write_status("Starting Spring Boot application...")
     print(f"{Colors.CYAN}Backend will be available at: http://localhost:{backend_port}{Colors.ENDC}")
@@ -389,11 +751,19 @@ def start_backend():
     print("")
 
     # Start the backend with custom port
-    env = os.environ.copy()
-    env['SERVER_PORT'] = str(backend_port)
+    env = _env_with(SERVER_PORT=str(backend_port))
     try:
-        subprocess.run(f"{maven_cmd} spring-boot:run", cwd=backend_dir, shell=True, env=env)
+        offline = _maven_offline(backend_dir)
+        with _spawn(_maven_args(maven_cmd, backend_dir, "spring-boot:run"), cwd=backend_dir, env=env) as process:
+            process.wait()
+        if offline and process.returncode != 0:
+            write_status("Offline start failed, retrying online...", "WARNING")
+            _set_maven_offline(backend_dir, False)
+            with _spawn([maven_cmd, "spring-boot:run"], cwd=backend_dir, env=env) as process:
+                process.wait()
     except KeyboardInterrupt:
+        # The backend ran until the user stopped it, so its plugins are all cached
+        _set_maven_offline(backend_dir, True)
         print("\n")
         write_status("Backend stopped by user", "INFO")
     except Exception as e:
@@ -408,8 +778,8 @@ def start_frontend():
     
     # Find available ports
     write_status("Finding available ports...")
-    frontend_port = find_free_port(3002)
-    backend_port = find_free_port(8082)
+    ports = _find_free_ports({'frontend': FRONTEND_PORTS, 'backend': BACKEND_PORTS})
+    frontend_port, backend_port = ports['frontend'], ports['backend']
     
     if not frontend_port:
         write_status("Could not find available port for frontend (tried 3002-3011)", "ERROR")
@@ -421,20 +791,24 @@ def start_frontend():
     write_status(f"Using port {frontend_port} for frontend", "SUCCESS")
     write_status(f"Backend is expected on port {backend_port}", "INFO")
     
+    layout = _project_layout()
+
     # Navigate to frontend directory
     frontend_dir = "frontend"
-    if not os.path.exists(frontend_dir):
+    if not layout.has_frontend:
         write_status("Frontend directory not found!", "ERROR")
         sys.exit(1)
 
-    # Check if node_modules exists
-    if not os.path.exists(os.path.join(frontend_dir, "node_modules")):
+    # Install dependencies when missing or when the lockfile changed
+    if not layout.has_node_modules or _need_npm_install(frontend_dir):
         write_status("Installing frontend dependencies...")
-        success, stdout, stderr = run_command("npm install", cwd=frontend_dir, shell=True)
+        success, stdout, stderr = _npm_install(frontend_dir)
         if not success:
             write_status("Failed to install frontend dependencies!", "ERROR")
             print(stderr)
             sys.exit(1)
+        _write_install_stamp(frontend_dir)
+        layout.refresh()
         write_status("Frontend dependencies installed successfully", "SUCCESS")
 
     write_status("Starting React development server...")
@@ -445,11 +819,10 @@ def start_frontend():
     print("")
 
     # Start the frontend with custom port
-    env = os.environ.copy()
-    env['PORT'] = str(frontend_port)
-    env['REACT_APP_API_URL'] = f'http://localhost:{backend_port}/api'
+    env = _env_with(PORT=str(frontend_port), REACT_APP_API_URL=f'http://localhost:{backend_port}/api')
     try:
-        subprocess.run("npm start", cwd=frontend_dir, shell=True, env=env)
+        with _spawn(["npm", "start"], cwd=frontend_dir, env=env) as process:
+            process.wait()
     except KeyboardInterrupt:
         print("\n")
         write_status("Frontend stopped by user", "INFO")
@@ -466,6 +839,127 @@ def check_url(url, timeout=2):
     except:
         return False
 
+def _process_exit_waiter(process):
+    """Return (wait, close) where wait(seconds) blocks until the process exits or
+    the timeout elapses and returns True if the process has exited"""
+    pidfd_open = getattr(os, 'pidfd_open', None)
+    if pidfd_open and hasattr(select, 'poll'):
+        try:
+            pidfd = pidfd_open(process.pid)
+        except OSError:
+            pass
+        else:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return (lambda seconds: bool(poller.poll(int(seconds * 1000))),
+                    lambda: os.close(pidfd))
+
+    if hasattr(select, 'kqueue'):
+        try:
+            kq = select.kqueue()
+            kq.control([select.kevent(process.pid, filter=select.KQ_FILTER_PROC,
+                                      flags=select.KQ_EV_ADD, fflags=select.KQ_NOTE_EXIT)], 0, 0)
+        except OSError:
+            pass
+        else:
+            return (lambda seconds: bool(kq.control(None, 1, seconds)) or process.poll() is not None,
+                    kq.close)
+
+    def wait(seconds):
+        time.sleep(seconds)
+        return process.poll() is not None
+    return wait, lambda: None
+
+def _tcp_ready(port):
+    """Check if a port is accepting TCP connections"""
+    try:
+        socket.create_connection(('localhost', port), timeout=0.2).close()
+        return True
+    except OSError:
+        return False
+
+def wait_for_service(port, process, url=None, timeout=60):
+    """Wait until port accepts connections, backing off from 100ms to 2s between probes.
+    Returns False as soon as the process exits or once timeout seconds pass"""
+    wait_exit, close = _process_exit_waiter(process)
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    try:
+        while not _tcp_ready(port):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or process.poll() is not None:
+                return False
+            if wait_exit(min(delay, remaining)):
+                return False
+            print(".", end="", flush=True)
+            delay = min(delay * 2, 2)
+    finally:
+        close()
+
+    # The port is listening; the endpoint itself may still be warming up
+    if url and not check_url(url):
+        write_status(f"Port {port} is open but {url} did not respond with 200 yet", "WARNING")
+    return True
+
+def _open_log(path):
+    """Open a fresh, line-buffered startup log whose writes always land at the end"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    return os.fdopen(fd, 'w', buffering=1, encoding='utf-8')
+
+def _tail_lines(path, n=100, tail_bytes=256 * 1024):
+    """Return the last n lines of a file, reading at most tail_bytes from its end"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - tail_bytes))
+        data = f.read()
+    lines = data.decode('utf-8', 'replace').splitlines()
+    if size > tail_bytes:
+        # The first line is most likely cut in half
+        lines = lines[1:]
+    return lines[-n:]
+
+def report_start_failure(name, process, log, log_file):
+    """Explain why a service did not come up and show its startup log"""
+    print("")
+    if process.poll() is not None:
+        write_status(f"{name} exited with code {process.returncode}", "ERROR")
+    else:
+        write_status(f"{name} failed to start within 60 seconds", "ERROR")
+    write_status(f"Reading {name.lower()} logs...", "INFO")
+    log.close()
+
+    # Read and display the end of the log file
+    try:
+        lines = _tail_lines(log_file)
+        if lines:
+            print(f"\n{Colors.YELLOW}{'='*60}{Colors.ENDC}")
+            print(f"{Colors.RED}{name} Startup Logs (last 100 lines):{Colors.ENDC}")
+            print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
+            for line in lines:
+                print(line)
+            print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
+        else:
+            write_status("No logs generated yet", "WARNING")
+    except Exception as e:
+        write_status(f"Could not read log file: {e}", "ERROR")
+
+_RUNNING_BANNER = f"""\
+{Colors.GREEN}================================={Colors.ENDC}
+
+{Colors.CYAN}Frontend: http://localhost:{{frontend_port}}{Colors.ENDC}
+{Colors.CYAN}Backend API: http://localhost:{{backend_port}}/api{Colors.ENDC}
+{Colors.CYAN}Database: MongoDB on localhost:27017{Colors.ENDC}
+
+{Colors.YELLOW}Sample Login Credentials:{Colors.ENDC}
+{Colors.WHITE}   Username: john_doe | Password: demo123{Colors.ENDC}
+{Colors.WHITE}   Username: jane_smith | Password: demo123{Colors.ENDC}
+
+{Colors.RED}To stop all services: Press Ctrl+C{Colors.ENDC}
+
+{Colors.GREEN}Services are running. Press Ctrl+C to stop all services...{Colors.ENDC}
+"""
+
 def start_all():
     """Start both backend and frontend"""
     print(f"{Colors.BLUE}Starting Medium Blog Platform (All Services)...{Colors.ENDC}")
@@ -474,8 +968,8 @@ def start_all():
 
     # Find available ports
     write_status("Finding available ports...")
-    backend_port = find_free_port(8082)
-    frontend_port = find_free_port(3002)
+    ports = _find_free_ports({'backend': BACKEND_PORTS, 'frontend': FRONTEND_PORTS})
+    backend_port, frontend_port = ports['backend'], ports['frontend']
     
     if not backend_port:
         write_status("Could not find available port for backend (tried 8082-8091)", "ERROR")
@@ -503,10 +997,15 @@ def start_all():
     backend_log = None
     frontend_log = None
 
-    def cleanup(signum=None, frame=None):
-        """Cleanup function to stop services"""
+    preparing = ChildProcesses()
+
+    def cleanup(signum=None, frame=None, exit_code=0):
+        """Cleanup function to stop services, exiting with exit_code"""
         print("\n")
         write_status("Stopping services...")
+
+        # Stop a compile or npm install that is still running
+        preparing.stop_all()
         
         if backend_process:
             write_status("Stopping backend...")
@@ -533,185 +1032,193 @@ def start_all():
                 frontend_process.kill()
         
         write_status("Services stopped.", "SUCCESS")
-        sys.exit(0)
+        sys.exit(exit_code)
 
     # Set up signal handlers
     signal.signal(signal.SIGINT, cleanup)
     signal.signal(signal.SIGTERM, cleanup)
 
-    write_status("Starting Backend...")
+    layout = _project_layout()
 
     # Determine Maven command
     backend_dir = "backend"
     maven_cmd = None
     if test_command("mvn"):
         maven_cmd = "mvn"
-    elif os.path.exists(os.path.join(backend_dir, "mvnw")):
-        maven_cmd = "./mvnw"
+    elif layout.has_mvnw:
+        maven_cmd = _mvnw_path(backend_dir)
     else:
         write_status("Neither Maven nor Maven wrapper found!", "ERROR")
         sys.exit(1)
 
-    # Clean and compile backend first to ensure Lombok annotations are processed
-    write_status("Compiling backend (this may take a moment)...", "INFO")
-    success, stdout, stderr = run_command(f"{maven_cmd} clean compile", cwd=backend_dir, shell=True)
-    if not success:
-        write_status("Backend compilation failed!", "ERROR")
-        print(f"\n{Colors.RED}=== Compilation Error ==={Colors.ENDC}")
-        print(stderr)
-        sys.exit(1)
-    write_status("Backend compiled successfully", "SUCCESS")
+    frontend_dir = "frontend"
 
-    # Start backend in background with custom port
-    backend_env = os.environ.copy()
-    backend_env['SERVER_PORT'] = str(backend_port)
-    
-    # Create a log file for backend output
-    backend_log_file = os.path.join(backend_dir, "startup.log")
-    try:
-        backend_log = open(backend_log_file, 'w')
-        backend_process = subprocess.Popen(
-            f"{maven_cmd} spring-boot:run",
-            cwd=backend_dir,
-            shell=True,
-            stdout=backend_log,
-            stderr=subprocess.STDOUT,
-            env=backend_env
-        )
-        write_status(f"Backend logs: {os.path.abspath(backend_log_file)}", "INFO")
-    except Exception as e:
-        write_status(f"Error starting backend: {e}", "ERROR")
-        sys.exit(1)
+    def prepare_backend():
+        """Compile backend first to ensure Lombok annotations are processed,
+        unless nothing changed since the last successful compile"""
+        digest = _source_digest(backend_dir)
+        if not _sources_changed(backend_dir, digest):
+            write_status("Backend sources unchanged, skipping compile", "INFO")
+            return True
+        write_status("Compiling backend (this may take a moment)...", "INFO")
+        success, stdout, stderr = _compile_backend(
+            maven_cmd, backend_dir, show_output=True, prefix="[backend] ", children=preparing)
+        if success:
+            _write_source_stamp(backend_dir, digest)
+            write_status("Backend compiled successfully", "SUCCESS")
+        return success
 
-    write_status("Waiting for backend to start...")
-    backend_started = False
-    for i in range(30):
-        if check_url(f"http://localhost:{backend_port}/api/posts"):
-            write_status(f"Backend is running on http://localhost:{backend_port}", "SUCCESS")
-            backend_started = True
-            break
-        time.sleep(2)
-        print(".", end="", flush=True)
-
-    if not backend_started:
-        print("")
-        write_status("Backend failed to start within 60 seconds", "ERROR")
-        write_status("Reading backend logs...", "INFO")
-        backend_log.close()
-        
-        # Read and display the log file
-        try:
-            with open(backend_log_file, 'r') as log:
-                log_contents = log.read()
-                if log_contents:
-                    print(f"\n{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-                    print(f"{Colors.RED}Backend Startup Logs (last 100 lines):{Colors.ENDC}")
-                    print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-                    # Show last 100 lines
-                    lines = log_contents.splitlines()
-                    for line in lines[-100:]:
-                        print(line)
-                    print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-                else:
-                    write_status("No logs generated yet", "WARNING")
-        except Exception as e:
-            write_status(f"Could not read log file: {e}", "ERROR")
-        
-        cleanup()
+    def prepare_frontend():
+        """Install dependencies when missing or when the lockfile changed"""
+        if layout.has_node_modules and not _need_npm_install(frontend_dir):
+            return True
+        write_status("Installing frontend dependencies...")
+        success, stdout, stderr = _npm_install(
+            frontend_dir, show_output=True, prefix="[frontend] ", children=preparing)
+        if success:
+            _write_install_stamp(frontend_dir)
+            layout.refresh()
+            write_status("Frontend dependencies installed successfully", "SUCCESS")
+        return success
 
-    print("")
-    write_status("Starting Frontend...")
+    # Every background step reports (step, result) here when it finishes. The
+    # threads are daemons, so a failure in one never waits on the other
+    events = queue.Queue()
 
-    # Start frontend in background
-    frontend_dir = "frontend"
-    
-    # Check if node_modules exists
-    if not os.path.exists(os.path.join(frontend_dir, "node_modules")):
-        write_status("Installing frontend dependencies...")
-        success, stdout, stderr = run_command("npm install", cwd=frontend_dir, shell=True)
-        if not success:
-            write_status("Failed to install frontend dependencies!", "ERROR")
-            cleanup()
+    def run_step(step, func, *args):
+        """Run func in a background thread and report its result on events"""
+        def target():
+            result = False
+            try:
+                result = func(*args)
+            finally:
+                events.put((step, result))
+        threading.Thread(target=target, daemon=True).start()
 
-    # Set up frontend environment with custom port
-    frontend_env = os.environ.copy()
-    frontend_env['PORT'] = str(frontend_port)
-    frontend_env['REACT_APP_API_URL'] = f'http://localhost:{backend_port}/api'
-    
-    # Create a log file for frontend output
+    # Set up service environments with custom ports; the frontend only needs
+    # to know the backend port, not a running backend
+    backend_env = _env_with(SERVER_PORT=str(backend_port))
+    frontend_env = _env_with(PORT=str(frontend_port), REACT_APP_API_URL=f'http://localhost:{backend_port}/api')
+    backend_url = f"http://localhost:{backend_port}/api/posts"
+    frontend_url = f"http://localhost:{frontend_port}"
+
+    # Create log files for service output
+    backend_log_file = os.path.join(backend_dir, "startup.log")
     frontend_log_file = os.path.join(frontend_dir, "startup.log")
-    try:
-        frontend_log = open(frontend_log_file, 'w')
-        frontend_process = subprocess.Popen(
-            "npm start",
-            cwd=frontend_dir,
-            shell=True,
-            stdout=frontend_log,
+
+    def launch_backend(online=False):
+        """Start the backend in the background, logging to backend_log_file.
+        Returns True if it was started offline"""
+        nonlocal backend_process, backend_log
+        if online:
+            cmd = [maven_cmd, "spring-boot:run"]
+        else:
+            cmd = _maven_args(maven_cmd, backend_dir, "spring-boot:run")
+        backend_log = _open_log(backend_log_file)
+        backend_process = _spawn(
+            cmd,
+            cwd=backend_dir,
+            stdout=backend_log,
             stderr=subprocess.STDOUT,
-            env=frontend_env
+            env=backend_env
         )
-        write_status(f"Frontend logs: {os.path.abspath(frontend_log_file)}", "INFO")
-    except Exception as e:
-        write_status(f"Error starting frontend: {e}", "ERROR")
-        cleanup()
+        return "-o" in cmd
 
-    write_status("Waiting for frontend to start...")
-    frontend_started = False
-    for i in range(30):
-        if check_url(f"http://localhost:{frontend_port}"):
-            write_status(f"Frontend is running on http://localhost:{frontend_port}", "SUCCESS")
-            frontend_started = True
-            break
-        time.sleep(2)
-        print(".", end="", flush=True)
-
-    if not frontend_started:
-        print("")
-        write_status("Frontend failed to start within 60 seconds", "ERROR")
-        write_status("Reading frontend logs...", "INFO")
-        frontend_log.close()
-        
-        # Read and display the log file
+    # Compile the backend and install frontend dependencies side by side; each
+    # service starts as soon as its own preparation step is done
+    write_status("Preparing backend and frontend...")
+    run_step("backend built", prepare_backend)
+    run_step("frontend installed", prepare_frontend)
+    backend_offline = False
+    outstanding = 2
+    while outstanding:
+        # A blocking get() can't be interrupted by Ctrl+C on Windows, so poll
+        # there; elsewhere just block until a step finishes
         try:
-            with open(frontend_log_file, 'r') as log:
-                log_contents = log.read()
-                if log_contents:
-                    print(f"\n{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-                    print(f"{Colors.RED}Frontend Startup Logs (last 100 lines):{Colors.ENDC}")
-                    print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-                    # Show last 100 lines
-                    lines = log_contents.splitlines()
-                    for line in lines[-100:]:
-                        print(line)
-                    print(f"{Colors.YELLOW}{'='*60}{Colors.ENDC}")
-                else:
-                    write_status("No logs generated yet", "WARNING")
-        except Exception as e:
-            write_status(f"Could not read log file: {e}", "ERROR")
+            step, ok = events.get(timeout=0.5 if os.name == "nt" else None)
+        except queue.Empty:
+            continue
+        outstanding -= 1
+        if step == "backend built":
+            if not ok:
+                write_status("Backend compilation failed!", "ERROR")
+                print(f"{Colors.RED}See the [backend] output above for details{Colors.ENDC}")
+                cleanup(exit_code=1)
+            try:
+                # The compile may have just dropped the offline marker, so it is
+                # only read now, at launch time
+                backend_offline = launch_backend()
+                write_status(f"Backend logs: {os.path.abspath(backend_log_file)}", "INFO")
+            except Exception as e:
+                write_status(f"Error starting backend: {e}", "ERROR")
+                cleanup(exit_code=1)
+            write_status("Waiting for backend to start...")
+            run_step("backend ready", wait_for_service, backend_port, backend_process, backend_url)
+            outstanding += 1
+        elif step == "frontend installed":
+            if not ok:
+                write_status("Failed to install frontend dependencies!", "ERROR")
+                cleanup(exit_code=1)
+            try:
+                frontend_log = _open_log(frontend_log_file)
+                frontend_process = _spawn(
+                    ["npm", "start"],
+                    cwd=frontend_dir,
+                    stdout=frontend_log,
+                    stderr=subprocess.STDOUT,
+                    env=frontend_env
+                )
+                write_status(f"Frontend logs: {os.path.abspath(frontend_log_file)}", "INFO")
+            except Exception as e:
+                write_status(f"Error starting frontend: {e}", "ERROR")
+                cleanup(exit_code=1)
+            write_status("Waiting for frontend to start...")
+            run_step("frontend ready", wait_for_service, frontend_port, frontend_process, frontend_url)
+            outstanding += 1
+        elif step == "backend ready":
+            # A backend failure stops everything
+            if ok:
+                print("")
+                write_status(f"Backend is running on http://localhost:{backend_port}", "SUCCESS")
+                _set_maven_offline(backend_dir, True)
+            elif backend_offline and backend_process.poll() is not None:
+                print("")
+                write_status("Offline backend start failed, retrying online...", "WARNING")
+                _set_maven_offline(backend_dir, False)
+                backend_log.close()
+                backend_offline = launch_backend(online=True)
+                run_step("backend ready", wait_for_service, backend_port, backend_process, backend_url)
+                outstanding += 1
+            else:
+                report_start_failure("Backend", backend_process, backend_log, backend_log_file)
+                cleanup(exit_code=1)
+        elif ok:
+            print("")
+            write_status(f"Frontend is running on http://localhost:{frontend_port}", "SUCCESS")
+        else:
+            report_start_failure("Frontend", frontend_process, frontend_log, frontend_log_file)
 
     print("")
     write_status("Medium Blog Platform is running!", "SUCCESS")
-    print(f"{Colors.GREEN}================================={Colors.ENDC}")
-    print("")
-    print(f"{Colors.CYAN}Frontend: http://localhost:{frontend_port}{Colors.ENDC}")
-    print(f"{Colors.CYAN}Backend API: http://localhost:{backend_port}/api{Colors.ENDC}")
-    print(f"{Colors.CYAN}Database: MongoDB on localhost:27017{Colors.ENDC}")
-    print("")
-    print(f"{Colors.YELLOW}Sample Login Credentials:{Colors.ENDC}")
-    print(f"{Colors.WHITE}   Username: john_doe | Password: demo123{Colors.ENDC}")
-    print(f"{Colors.WHITE}   Username: jane_smith | Password: demo123{Colors.ENDC}")
-    print("")
-    print(f"{Colors.RED}To stop all services: Press Ctrl+C{Colors.ENDC}")
-    print("")
+    sys.stdout.write(_RUNNING_BANNER.format(frontend_port=frontend_port, backend_port=backend_port))
 
-    # Keep script running
-    print(f"{Colors.GREEN}Services are running. Press Ctrl+C to stop all services...{Colors.ENDC}")
+    # Keep script running until a service exits or Ctrl+C triggers cleanup()
+    waitid = getattr(os, 'waitid', None)
     try:
-        while True:
-            time.sleep(1)
+        while backend_process.poll() is None and frontend_process.poll() is None:
+            if waitid:
+                # Block until any child exits; WNOWAIT leaves it for Popen to reap
+                waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+            else:
+                time.sleep(1)
     except KeyboardInterrupt:
         cleanup()
 
+    for name, process in (("Backend", backend_process), ("Frontend", frontend_process)):
+        if process.poll() is not None:
+            write_status(f"{name} exited unexpectedly with code {process.returncode}", "ERROR")
+    cleanup(exit_code=1)
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(